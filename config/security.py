@@ -10,6 +10,9 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Oracle username format: starts with a letter, then letters, digits or underscores
+_USERNAME_FORMAT_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9_]*$')
+
 
 class SecureConfigLogger:
     """Secure logging for configuration with credential masking"""
@@ -212,7 +215,7 @@ def validate_credential_format(username: str, password: str) -> List[str]:
         errors.append("Username cannot be empty")
     elif len(username) < 2:
         errors.append("Username must be at least 2 characters long")
-    elif not re.match(r'^[a-zA-Z][a-zA-Z0-9_]*$', username):
+    elif not _USERNAME_FORMAT_RE.match(username):
         errors.append("Username must start with a letter and contain only letters, numbers, and underscores")
     
     # Password validation
@@ -222,12 +225,9 @@ def validate_credential_format(username: str, password: str) -> List[str]:
         errors.append("Password must be at least 6 characters long")
     
     # Check for password complexity (basic)
+    # (single pass that stops at the first upper/lower/digit character)
     if password and len(password) >= 6:
-        has_upper = any(c.isupper() for c in password)
-        has_lower = any(c.islower() for c in password)
-        has_digit = any(c.isdigit() for c in password)
-        
-        if not (has_upper or has_lower or has_digit):
+        if not any(c.isupper() or c.islower() or c.isdigit() for c in password):
             errors.append("Password should contain at least one letter or digit")
     
     return errors
\ No newline at end of file